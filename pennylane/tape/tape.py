@@ -799,15 +799,12 @@ class QuantumTape(AnnotatedQueue):
         >>> tape.get_parameters(trainable_only=False)
         [0.432, 0.543, 0.133]
         """
-        params = []
-        iterator = self.trainable_params if trainable_only else self._par_info
-
-        for p_idx in iterator:
-            op = self._par_info[p_idx]["op"]
-            op_idx = self._par_info[p_idx]["p_idx"]
-            params.append(op.data[op_idx])
+        if trainable_only:
+            par_info = [self._par_info[p_idx] for p_idx in self.trainable_params]
+        else:
+            par_info = self._par_info.values()
 
-        return params
+        return [info["op"].data[info["p_idx"]] for info in par_info]
 
     def set_parameters(self, params, trainable_only=True):
         """Set the parameters incident on the tape operations.
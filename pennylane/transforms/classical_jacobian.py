@@ -15,9 +15,16 @@
 Contains the classical Jacobian transform.
 """
 # pylint: disable=import-outside-toplevel
+import functools
+
+import autoray as ar
+
 import pennylane as qml
 from pennylane import numpy as np
 
+# QNode interface names that differ from the corresponding autoray backend names
+_AUTORAY_BACKENDS = {"tf": "tensorflow"}
+
 
 def classical_jacobian(qnode, argnum=None):
     r"""Returns a function to extract the Jacobian
@@ -133,70 +140,163 @@ def classical_jacobian(qnode, argnum=None):
 
     """
 
+    build_jacobian = _interface_jacobian_builder(qnode.interface)
+
+    if build_jacobian is None:
+        return None
+
+    stack = _interface_stack(qnode.interface)
+
     def classical_preprocessing(*args, **kwargs):
         """Returns the trainable gate parameters for a given QNode input."""
         trainable_only = kwargs.pop("_trainable_only", True)
         qnode.construct(args, kwargs)
-        return qml.math.stack(qnode.qtape.get_parameters(trainable_only=trainable_only))
-
-    if qnode.interface == "autograd":
-
-        def _jacobian(*args, **kwargs):
-            if argnum is None:
-                jac = qml.jacobian(classical_preprocessing)(*args, **kwargs)
-            elif np.isscalar(argnum):
-                jac = qml.jacobian(classical_preprocessing, argnum=argnum)(*args, **kwargs)
-            else:
-                jac = tuple(
-                    (
-                        qml.jacobian(classical_preprocessing, argnum=i)(*args, **kwargs)
-                        for i in argnum
-                    )
-                )
-            return jac
-
-        return _jacobian
-
-    if qnode.interface == "torch":
-        import torch
+        return stack(qnode.qtape.get_parameters(trainable_only=trainable_only))
 
-        def _jacobian(*args, **kwargs):  # pylint: disable=unused-argument
-            jac = torch.autograd.functional.jacobian(classical_preprocessing, args)
-            if argnum is not None:
-                if np.isscalar(argnum):
-                    jac = jac[argnum]
+    return build_jacobian(classical_preprocessing, argnum)
+
+
+@functools.lru_cache(maxsize=None)
+def _interface_stack(interface):
+    """Returns a function that stacks a sequence of tensors of the given interface.
+
+    This is equivalent to :func:`~.math.stack`, but the framework functions are resolved
+    once per interface rather than dispatched on the types of the tensors on every call.
+
+    Args:
+        interface (str): the QNode interface
+
+    Returns:
+        function: Function that coerces and stacks a sequence of tensor-like objects
+    """
+    backend = _AUTORAY_BACKENDS.get(interface, interface)
+    coerce = ar.get_lib_fn(backend, "coerce")
+    stack = ar.get_lib_fn(backend, "stack")
+
+    def _stack(values):
+        if not values:
+            # defer to qml.math.stack, so that empty input fails with the same error
+            return qml.math.stack(values)
+
+        return stack(coerce(values))
+
+    return _stack
+
+
+def _is_vmap_error(error):
+    """Whether a Torch ``RuntimeError`` was raised because an operation does not
+    support vectorization, rather than by the function being differentiated."""
+    message = str(error)
+    return "Batching rule not implemented" in message or "vmap" in message
+
+
+@functools.lru_cache(maxsize=None)
+def _interface_jacobian_builder(interface):
+    """Returns a factory that creates the Jacobian function of the classical
+    preprocessing for the given interface.
+
+    The framework import and the lookup of its Jacobian function are performed only
+    once per interface, rather than every time ``classical_jacobian`` is called.
+
+    Args:
+        interface (str): the QNode interface
+
+    Returns:
+        function or None: Function ``build(fn, argnum)`` that returns the Jacobian
+        function of ``fn`` with respect to the arguments indexed by ``argnum``. ``None``
+        is returned if the interface is not supported.
+    """
+    if interface == "autograd":
+        jacobian = qml.jacobian
+
+        def build(fn, argnum):
+            def _jacobian(*args, **kwargs):
+                if argnum is None:
+                    jac = jacobian(fn)(*args, **kwargs)
+                elif np.isscalar(argnum):
+                    jac = jacobian(fn, argnum=argnum)(*args, **kwargs)
                 else:
-                    jac = tuple((jac[idx] for idx in argnum))
-            return jac
+                    jac = tuple((jacobian(fn, argnum=i)(*args, **kwargs) for i in argnum))
+                return jac
+
+            return _jacobian
+
+        return build
+
+    if interface == "torch":
+        import torch
+
+        jacobian = torch.autograd.functional.jacobian
 
-        return _jacobian
+        # Vectorizing computes all rows of the Jacobian with a single batched
+        # backward pass, rather than one backward pass per gate argument. It is
+        # experimental in Torch, and raises for operations without a batching
+        # rule; after the first such failure, the loop is used for all calls.
+        vectorize = True
 
-    if qnode.interface == "jax":
+        def build(fn, argnum):
+            def _jacobian(*args, **kwargs):  # pylint: disable=unused-argument
+                nonlocal vectorize
+
+                if vectorize:
+                    try:
+                        jac = jacobian(fn, args, vectorize=True)
+                    except RuntimeError as e:
+                        if not _is_vmap_error(e):
+                            raise
+                        vectorize = False
+
+                if not vectorize:
+                    jac = jacobian(fn, args)
+
+                if argnum is not None:
+                    if np.isscalar(argnum):
+                        jac = jac[argnum]
+                    else:
+                        jac = tuple((jac[idx] for idx in argnum))
+                return jac
+
+            return _jacobian
+
+        return build
+
+    if interface == "jax":
         import jax
 
-        argnum = 0 if argnum is None else argnum
+        def build(fn, argnum):
+            argnum = 0 if argnum is None else argnum
+            jac_fn = jax.jacobian(fn, argnums=argnum)
 
-        def _jacobian(*args, **kwargs):
-            kwargs["_trainable_only"] = False
-            return jax.jacobian(classical_preprocessing, argnums=argnum)(*args, **kwargs)
+            def _jacobian(*args, **kwargs):
+                kwargs["_trainable_only"] = False
+                return jac_fn(*args, **kwargs)
 
-        return _jacobian
+            return _jacobian
 
-    if qnode.interface == "tf":
+        return build
+
+    if interface == "tf":
         import tensorflow as tf
 
-        def _jacobian(*args, **kwargs):
-            if np.isscalar(argnum):
-                sub_args = args[argnum]
-            elif argnum is None:
-                sub_args = args
-            else:
-                sub_args = tuple((args[i] for i in argnum))
+        def build(fn, argnum):
+            def _jacobian(*args, **kwargs):
+                if np.isscalar(argnum):
+                    sub_args = args[argnum]
+                elif argnum is None:
+                    sub_args = args
+                else:
+                    sub_args = tuple((args[i] for i in argnum))
+
+                with tf.GradientTape() as tape:
+                    gate_params = fn(*args, **kwargs)
+
+                # Use the pfor-vectorized Jacobian. Arguments that the gate parameters
+                # do not depend on are left as None, so that they can be skipped
+                jac = tape.jacobian(gate_params, sub_args, experimental_use_pfor=True)
+                return jac
 
-            with tf.GradientTape() as tape:
-                gate_params = classical_preprocessing(*args, **kwargs)
+            return _jacobian
 
-            jac = tape.jacobian(gate_params, sub_args)
-            return jac
+        return build
 
-        return _jacobian
+    return None
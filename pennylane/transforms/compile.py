@@ -20,6 +20,7 @@ from pennylane.tape import get_active_tape
 from pennylane.ops import __all__ as all_ops
 
 from pennylane.transforms import single_tape_transform, qfunc_transform
+from pennylane.transforms.qfunc_transforms import _iter_ops
 from pennylane.transforms.optimization import cancel_inverses, commute_controlled, merge_rotations
 
 
@@ -160,5 +161,5 @@ def compile(tape, pipeline=None, basis_set=None, num_passes=1, expand_depth=5):
                     expanded_tape = transform.tape_fn(expanded_tape)
 
     # Queue the operations on the optimized tape
-    for op in expanded_tape.operations + expanded_tape.measurements:
+    for op in _iter_ops(expanded_tape):
         apply(op)
@@ -15,6 +15,7 @@
 # pylint: disable=too-few-public-methods
 import functools
 import inspect
+import itertools
 
 import pennylane as qml
 
@@ -75,6 +76,21 @@ def make_tape(fn):
     return wrapper
 
 
+def _iter_ops(tape):
+    """Returns an iterator over the operations and measurements of a tape.
+
+    This avoids creating the concatenated list ``tape.operations + tape.measurements``.
+
+    Args:
+        tape (.QuantumTape): the input tape
+
+    Returns:
+        Iterator[.Operation or .MeasurementProcess]: the operations of the tape,
+        followed by its measurements
+    """
+    return itertools.chain(tape.operations, tape.measurements)
+
+
 class NonQueuingTape(qml.queuing.AnnotatedQueue):
     """Mixin class that creates a tape that does not queue
     itself to the current queuing context."""
@@ -82,10 +98,36 @@ class NonQueuingTape(qml.queuing.AnnotatedQueue):
     def _process_queue(self):
         super()._process_queue()
 
+        # The active context cannot change while the queue is processed,
+        # so look it up once rather than once per queued object
+        context = qml.queuing.QueuingContext.active_context()
+
+        if context is None:
+            return
+
+        append = context._append  # pylint: disable=protected-access
+
         for obj, info in self._queue.items():
-            qml.queuing.QueuingContext.append(obj, **info)
+            append(obj, **info)
+
+        context._remove(self)  # pylint: disable=protected-access
+
+
+@functools.lru_cache(maxsize=None)
+def _non_queuing_tape_class(tape_class):
+    """Returns a subclass of the tape class ``tape_class`` that does not
+    queue itself to the current queuing context.
+
+    The subclass is created only once per tape class, rather than every
+    time a tape transform is applied.
 
-        qml.queuing.QueuingContext.remove(self)
+    Args:
+        tape_class (type): the tape class to subclass
+
+    Returns:
+        type: the subclass ``(NonQueuingTape, tape_class)``
+    """
+    return type(tape_class.__name__, (NonQueuingTape, tape_class), {})
 
 
 class single_tape_transform:
@@ -157,7 +199,7 @@ class single_tape_transform:
         functools.update_wrapper(self, transform_fn)
 
     def __call__(self, tape, *args, **kwargs):
-        tape_class = type(tape.__class__.__name__, (NonQueuingTape, tape.__class__), {})
+        tape_class = _non_queuing_tape_class(tape.__class__)
 
         # new_tape, when first created, is of the class (NonQueuingTape, tape.__class__), so that it
         # doesn't result in a nested tape
@@ -178,15 +220,17 @@ def _create_qfunc_internal_wrapper(fn, tape_transform, transform_args, transform
             "to be a valid Python function or callable."
         )
 
+    tape_fn = make_tape(fn)
+
     @functools.wraps(fn)
     def internal_wrapper(*args, **kwargs):
-        tape = make_tape(fn)(*args, **kwargs)
-        tape = tape_transform(tape, *transform_args, **transform_kwargs)
+        tape = tape_fn(*args, **kwargs)
+        measurements = tape_transform(tape, *transform_args, **transform_kwargs).measurements
 
-        if len(tape.measurements) == 1:
-            return tape.measurements[0]
+        if len(measurements) == 1:
+            return measurements[0]
 
-        return tape.measurements
+        return measurements
 
     return internal_wrapper
 
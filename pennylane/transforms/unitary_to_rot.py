@@ -16,6 +16,7 @@ A transform for decomposing arbitrary single-qubit QubitUnitary gates into eleme
 """
 import pennylane as qml
 from pennylane.transforms import qfunc_transform
+from pennylane.transforms.qfunc_transforms import _iter_ops
 from pennylane.transforms.decompositions import zyz_decomposition, two_qubit_decomposition
 
 
@@ -128,7 +129,7 @@ def unitary_to_rot(tape):
                 return qml.expval(qml.PauliX(wires="a"))
     """
 
-    for op in tape.operations + tape.measurements:
+    for op in _iter_ops(tape):
         if isinstance(op, qml.QubitUnitary):
             # Single-qubit unitary operations
             if qml.math.shape(op.parameters[0]) == (2, 2):
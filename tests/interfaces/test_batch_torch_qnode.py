@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Integration tests for using the Torch interface with a QNode"""
+import functools
+
 import pytest
 import numpy as np
 
@@ -19,6 +21,7 @@ torch = pytest.importorskip("torch", minversion="1.3")
 from torch.autograd.functional import hessian, jacobian
 
 import pennylane as qml
+from pennylane import numpy as anp
 from pennylane.beta import qnode, QNode
 from pennylane.tape import JacobianTape
 
@@ -31,17 +34,77 @@ qubit_device_and_diff_method = [
     ["default.qubit", "adjoint", "backward"],
 ]
 
+# Subsets of the above, for tests that only support some of the differentiation methods
+FD_ONLY = [["default.qubit", "finite-diff", "backward"]]
+PS_ONLY = [["default.qubit", "parameter-shift", "backward"]]
+PS_BP = [
+    ["default.qubit", "parameter-shift", "backward"],
+    ["default.qubit", "backprop", "forward"],
+]
+ALL_BUT_BP = [m for m in qubit_device_and_diff_method if m[1] != "backprop"]
+ALL_BUT_ADJOINT = [m for m in qubit_device_and_diff_method if m[1] != "adjoint"]
+BACKWARD_ONLY = [m for m in qubit_device_and_diff_method if m[2] == "backward"]
+
+# Parameter values shared by several tests. Tests clone these before enabling
+# gradient tracking, so that the module-level tensors are never modified.
+_A01 = torch.tensor(0.1, dtype=torch.float64)
+_B02 = torch.tensor(0.2, dtype=torch.float64)
+_AB_SHOTS = torch.tensor([0.543, -0.654], dtype=torch.float64)
+_X12 = torch.tensor([1.0, 2.0], dtype=torch.float64)
+
+# Pauli-X matrix parameter, as a NumPy array and as a Torch tensor sharing its memory
+_U_NP = np.array([[0, 1], [1, 0]])
+_U_TORCH = torch.from_numpy(_U_NP)
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_res(a, b):
+    """Expected output ``[<Z_0>, <Y_1>]`` of the circuit ``RY(a)`` on wire 0,
+    ``RX(b)`` on wire 1, followed by a CNOT"""
+    return np.cos(a), -np.cos(a) * np.sin(b)
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_grad(a, b):
+    """Expected gradient of the sum of the outputs of the circuit in :func:`_expected_res`"""
+    return -np.sin(a) + np.sin(a) * np.sin(b), -np.cos(a) * np.cos(b)
+
+
+def _close(a, b, tol):
+    """Whether the Torch tensor ``a`` is equal to ``b``, within the absolute tolerance ``tol``"""
+    a = a.detach()
+    return torch.allclose(a, torch.as_tensor(b, dtype=a.dtype), atol=tol, rtol=0)
+
+
+@pytest.fixture(scope="module")
+def device_factory():
+    """Returns a function that creates devices, reusing a single device
+    instance per ``(name, wires, shots)`` combination within this module."""
+    cache = {}
+
+    def make(name, wires, shots=None):
+        key = (name, wires, shots)
+
+        if key not in cache:
+            cache[key] = qml.device(name, wires=wires, shots=shots)
+
+        # restore the cached device to its freshly constructed state
+        dev = cache[key]
+        dev.shots = shots
+        dev.reset()
+        dev._num_executions = 0  # pylint: disable=protected-access
+        return dev
+
+    return make
+
 
-@pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
 class TestQNode:
     """Test that using the QNode with Torch integrates with the PennyLane stack"""
 
-    def test_execution_with_interface(self, dev_name, diff_method, mode):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_BP)
+    def test_execution_with_interface(self, device_factory, dev_name, diff_method, mode):
         """Test execution works with the interface"""
-        if diff_method == "backprop":
-            pytest.skip("Test does not support backprop")
-
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit(a):
@@ -68,10 +131,11 @@ class TestQNode:
         assert isinstance(grad, torch.Tensor)
         assert grad.shape == tuple()
 
-    def test_interface_swap(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    def test_interface_swap(self, device_factory, dev_name, diff_method, mode, tol):
         """Test that the Torch interface can be applied to a QNode
         with a pre-existing interface"""
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, interface="autograd")
         def circuit(a):
@@ -79,8 +143,6 @@ class TestQNode:
             qml.RX(0.2, wires=0)
             return qml.expval(qml.PauliZ(0))
 
-        from pennylane import numpy as anp
-
         a = anp.array(0.1, requires_grad=True)
 
         res1 = circuit(a)
@@ -95,50 +157,40 @@ class TestQNode:
         res2 = circuit(a)
         res2.backward()
         grad2 = a.grad
-        assert np.allclose(res1, res2.detach().numpy(), atol=tol, rtol=0)
-        assert np.allclose(grad1, grad2, atol=tol, rtol=0)
-
-    def test_drawing(self, dev_name, diff_method, mode):
-        """Test circuit drawing when using the torch interface"""
-
-        x = torch.tensor(0.1, requires_grad=True)
-        y = torch.tensor([0.2, 0.3], requires_grad=True)
-        z = torch.tensor(0.4, requires_grad=True)
-
-        dev = qml.device("default.qubit", wires=2)
+        assert _close(res2, res1, tol)
+        assert _close(grad2, grad1, tol)
 
-        @qnode(dev, interface="torch")
-        def circuit(p1, p2=y, **kwargs):
-            qml.RX(p1, wires=0)
-            qml.RY(p2[0] * p2[1], wires=1)
-            qml.RX(kwargs["p3"], wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.probs(wires=0), qml.var(qml.PauliZ(1))
-
-        circuit(p1=x, p3=z)
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    def test_jacobian(self, device_factory, dev_name, diff_method, mode, mocker, monkeypatch, tol):
+        """Test jacobian calculation"""
+        num_transform_calls = 0
 
-        result = qml.draw(circuit)(p1=x, p3=z)
-        expected = """\
- 0: ──RX(0.1)───RX(0.4)──╭C──┤ Probs  
- 1: ──RY(0.06)───────────╰X──┤ Var[Z] 
-"""
+        if diff_method in ("parameter-shift", "finite-diff"):
+            # only the number of calls is checked, so count them
+            # rather than recording every call with a spy
+            transform = {
+                "parameter-shift": qml.gradients.param_shift,
+                "finite-diff": qml.gradients.finite_diff,
+            }[diff_method]
+            transform_fn = transform.transform_fn
 
-        assert result == expected
+            def counting_transform_fn(*args, **kwargs):
+                nonlocal num_transform_calls
+                num_transform_calls += 1
+                return transform_fn(*args, **kwargs)
 
-    def test_jacobian(self, dev_name, diff_method, mode, mocker, tol):
-        """Test jacobian calculation"""
-        if diff_method == "parameter-shift":
-            spy = mocker.spy(qml.gradients.param_shift, "transform_fn")
-        elif diff_method == "finite-diff":
-            spy = mocker.spy(qml.gradients.finite_diff, "transform_fn")
+            monkeypatch.setattr(transform, "transform_fn", counting_transform_fn)
 
         a_val = 0.1
         b_val = 0.2
 
-        a = torch.tensor(a_val, dtype=torch.float64, requires_grad=True)
-        b = torch.tensor(b_val, dtype=torch.float64, requires_grad=True)
+        a = _A01.clone().requires_grad_(True)
+        b = _B02.clone().requires_grad_(True)
 
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
+
+        if diff_method == "adjoint":
+            spy = mocker.spy(dev, "adjoint_jacobian")
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit(a, b):
@@ -154,32 +206,30 @@ class TestQNode:
         assert isinstance(res, torch.Tensor)
         assert res.shape == (2,)
 
-        expected = [np.cos(a_val), -np.cos(a_val) * np.sin(b_val)]
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        expected = torch.tensor(_expected_res(a_val, b_val), dtype=torch.float64)
+        assert _close(res, expected, tol)
 
-        loss = torch.sum(res)
-
-        loss.backward()
-        expected = [
-            -np.sin(a_val) + np.sin(a_val) * np.sin(b_val),
-            -np.cos(a_val) * np.cos(b_val),
-        ]
-        assert np.allclose(a.grad, expected[0], atol=tol, rtol=0)
-        assert np.allclose(b.grad, expected[1], atol=tol, rtol=0)
+        res.backward(torch.ones_like(res))
+        expected = _expected_grad(a_val, b_val)
+        assert _close(a.grad, expected[0], tol)
+        assert _close(b.grad, expected[1], tol)
 
         if diff_method in ("parameter-shift", "finite-diff"):
-            spy.assert_called()
+            assert num_transform_calls > 0
 
-    @pytest.mark.xfail
-    def test_jacobian_dtype(self, dev_name, diff_method, mode, tol):
-        """Test calculating the jacobian with a different datatype"""
-        if diff_method == "backprop":
-            pytest.skip("Test does not support backprop")
+        elif diff_method == "adjoint":
+            # the adjoint method reuses the device state of the forward pass
+            spy.assert_called_with(mocker.ANY, use_device_state=True)
+            assert dev.num_executions == 1
 
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_BP)
+    @pytest.mark.xfail(run=False, reason="results are returned as float64 for float32 inputs")
+    def test_jacobian_dtype(self, device_factory, dev_name, diff_method, mode, tol):
+        """Test calculating the jacobian with a different datatype"""
         a = torch.tensor(0.1, dtype=torch.float32, requires_grad=True)
         b = torch.tensor(0.2, dtype=torch.float32, requires_grad=True)
 
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, interface="torch", diff_method=diff_method)
         def circuit(a, b):
@@ -202,16 +252,14 @@ class TestQNode:
         assert a.grad.dtype is torch.float32
         assert b.grad.dtype is torch.float32
 
-    def test_jacobian_options(self, dev_name, diff_method, mode, mocker, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", FD_ONLY)
+    def test_jacobian_options(self, device_factory, dev_name, diff_method, mode, mocker, tol):
         """Test setting jacobian options"""
-        if diff_method != "finite-diff":
-            pytest.skip("Test only works with finite-diff")
-
         spy = mocker.spy(qml.gradients.finite_diff, "transform_fn")
 
         a = torch.tensor([0.1, 0.2], requires_grad=True)
 
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch", h=1e-8, approx_order=2)
         def circuit(a):
@@ -222,23 +270,20 @@ class TestQNode:
         res = circuit(a)
         res.backward()
 
-        for args in spy.call_args_list:
-            assert args[1]["approx_order"] == 2
-            assert args[1]["h"] == 1e-8
+        # every call to the gradient transform received the Jacobian options
+        assert {(c[1]["approx_order"], c[1]["h"]) for c in spy.call_args_list} == {(2, 1e-8)}
 
-    def test_changing_trainability(self, dev_name, diff_method, mode, mocker, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", PS_ONLY)
+    def test_changing_trainability(self, device_factory, dev_name, diff_method, mode, mocker, tol):
         """Test that changing the trainability of parameters changes the
         number of differentiation requests made"""
-        if diff_method != "parameter-shift":
-            pytest.skip("Test only supports parameter-shift")
-
         a_val = 0.1
         b_val = 0.2
 
-        a = torch.tensor(a_val, dtype=torch.float64, requires_grad=True)
-        b = torch.tensor(b_val, dtype=torch.float64, requires_grad=True)
+        a = _A01.clone().requires_grad_(True)
+        b = _B02.clone().requires_grad_(True)
 
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, interface="torch", diff_method=diff_method)
         def circuit(a, b):
@@ -252,19 +297,15 @@ class TestQNode:
         # the tape has reported both gate arguments as trainable
         assert circuit.qtape.trainable_params == {0, 1}
 
-        expected = [np.cos(a_val), -np.cos(a_val) * np.sin(b_val)]
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        expected = _expected_res(a_val, b_val)
+        assert _close(res, expected, tol)
 
         spy = mocker.spy(qml.gradients.param_shift, "transform_fn")
 
-        loss = torch.sum(res)
-        loss.backward()
+        res.backward(torch.ones_like(res))
 
-        expected = [
-            -np.sin(a_val) + np.sin(a_val) * np.sin(b_val),
-            -np.cos(a_val) * np.cos(b_val),
-        ]
-        assert np.allclose([a.grad, b.grad], expected, atol=tol, rtol=0)
+        expected = _expected_grad(a_val, b_val)
+        assert _close(torch.stack([a.grad, b.grad]), expected, tol)
 
         # The parameter-shift rule has been called for each argument
         assert len(spy.spy_return[0]) == 4
@@ -281,25 +322,25 @@ class TestQNode:
         # the tape has reported only the first argument as trainable
         assert circuit.qtape.trainable_params == {0}
 
-        expected = [np.cos(a_val), -np.cos(a_val) * np.sin(b_val)]
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        expected = _expected_res(a_val, b_val)
+        assert _close(res, expected, tol)
 
         spy.call_args_list = []
-        loss = torch.sum(res)
-        loss.backward()
-        expected = -np.sin(a_val) + np.sin(a_val) * np.sin(b_val)
-        assert np.allclose(a.grad, expected, atol=tol, rtol=0)
+        res.backward(torch.ones_like(res))
+        expected = _expected_grad(a_val, b_val)[0]
+        assert _close(a.grad, expected, tol)
 
         # the gradient transform has only been called once
         assert len(spy.call_args_list) == 1
 
-    def test_classical_processing(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    def test_classical_processing(self, device_factory, dev_name, diff_method, mode, tol):
         """Test classical processing within the quantum tape"""
-        a = torch.tensor(0.1, dtype=torch.float64, requires_grad=True)
-        b = torch.tensor(0.2, dtype=torch.float64, requires_grad=False)
+        a = _A01.clone().requires_grad_(True)
+        b = _B02.clone()
         c = torch.tensor(0.3, dtype=torch.float64, requires_grad=True)
 
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit(a, b, c):
@@ -320,9 +361,10 @@ class TestQNode:
         assert b.grad is None
         assert isinstance(c.grad, torch.Tensor)
 
-    def test_no_trainable_parameters(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    def test_no_trainable_parameters(self, device_factory, dev_name, diff_method, mode, tol):
         """Test evaluation and Jacobian if there are no trainable parameters"""
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit(a, b):
@@ -348,20 +390,15 @@ class TestQNode:
         ):
             res.backward()
 
-    @pytest.mark.parametrize(
-        "U",
-        [
-            torch.tensor([[0, 1], [1, 0]], requires_grad=False),
-            np.array([[0, 1], [1, 0]]),
-        ],
-    )
-    def test_matrix_parameter(self, dev_name, diff_method, mode, U, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    @pytest.mark.parametrize("U", [_U_TORCH, _U_NP])
+    def test_matrix_parameter(self, device_factory, dev_name, diff_method, mode, U, tol):
         """Test that the Torch interface works correctly
         with a matrix parameter"""
         a_val = 0.1
-        a = torch.tensor(a_val, dtype=torch.float64, requires_grad=True)
+        a = _A01.clone().requires_grad_(True)
 
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit(U, a):
@@ -374,13 +411,14 @@ class TestQNode:
         if diff_method == "finite-diff":
             assert circuit.qtape.trainable_params == {1}
 
-        assert np.allclose(res.detach(), -np.cos(a_val), atol=tol, rtol=0)
+        assert _close(res, -torch.cos(a.detach()), tol)
 
         res.backward()
-        assert np.allclose(a.grad, np.sin(a_val), atol=tol, rtol=0)
+        assert _close(a.grad, np.sin(a_val), tol)
 
-    @pytest.mark.xfail
-    def test_differentiable_expand(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    @pytest.mark.xfail(run=False, reason="custom operation expansion is not yet supported")
+    def test_differentiable_expand(self, device_factory, dev_name, diff_method, mode, tol):
         """Test that operation and nested tapes expansion
         is differentiable"""
 
@@ -395,7 +433,7 @@ class TestQNode:
 
                 return tape
 
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
         a = np.array(0.1)
         p_val = [0.1, 0.2, 0.3]
         p = torch.tensor(p_val, dtype=torch.float64, requires_grad=True)
@@ -427,7 +465,7 @@ class TestQNode:
             np.cos(p_val[2]) * np.sin(p_val[1])
             + np.cos(p_val[0]) * np.cos(p_val[1]) * np.sin(p_val[2])
         )
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        assert _close(res, expected, tol)
 
         res.backward()
         expected = np.array(
@@ -444,17 +482,46 @@ class TestQNode:
                 ),
             ]
         )
-        assert np.allclose(p.grad, expected, atol=tol, rtol=0)
+        assert _close(p.grad, expected, tol)
+
+
+_EXPECTED_DRAWING = """\
+ 0: ──RX(0.1)───RX(0.4)──╭C──┤ Probs  
+ 1: ──RY(0.06)───────────╰X──┤ Var[Z] 
+"""
+
+
+def test_drawing(device_factory):
+    """Test circuit drawing when using the torch interface"""
+
+    x = torch.tensor(0.1, requires_grad=True)
+    y = torch.tensor([0.2, 0.3], requires_grad=True)
+    z = torch.tensor(0.4, requires_grad=True)
+
+    dev = device_factory("default.qubit", wires=2)
+
+    @qnode(dev, interface="torch")
+    def circuit(p1, p2=y, **kwargs):
+        qml.RX(p1, wires=0)
+        qml.RY(p2[0] * p2[1], wires=1)
+        qml.RX(kwargs["p3"], wires=0)
+        qml.CNOT(wires=[0, 1])
+        return qml.probs(wires=0), qml.var(qml.PauliZ(1))
+
+    circuit(p1=x, p3=z)
+
+    result = qml.draw(circuit)(p1=x, p3=z)
+    assert result == _EXPECTED_DRAWING
 
 
 class TestShotsIntegration:
     """Test that the QNode correctly changes shot value, and
     differentiates it."""
 
-    def test_changing_shots(self, mocker, tol):
+    def test_changing_shots(self, device_factory, mocker, tol):
         """Test that changing shots works on execution"""
-        dev = qml.device("default.qubit", wires=2, shots=None)
-        a, b = torch.tensor([0.543, -0.654], requires_grad=True, dtype=torch.float64)
+        dev = device_factory("default.qubit", wires=2, shots=None)
+        a, b = _AB_SHOTS.clone().requires_grad_(True)
 
         @qnode(dev, interface="torch", diff_method=qml.gradients.param_shift)
         def circuit(a, b):
@@ -465,9 +532,12 @@ class TestShotsIntegration:
 
         spy = mocker.spy(dev, "sample")
 
+        with torch.no_grad():
+            expected = -torch.cos(a) * torch.sin(b)
+
         # execute with device default shots (None)
         res = circuit(a, b)
-        assert torch.allclose(res, -torch.cos(a) * torch.sin(b), atol=tol, rtol=0)
+        assert torch.allclose(res, expected, atol=tol, rtol=0)
         spy.assert_not_called()
 
         # execute with shots=100
@@ -479,13 +549,13 @@ class TestShotsIntegration:
         assert dev.shots is None
         spy = mocker.spy(dev, "sample")
         res = circuit(a, b)
-        assert torch.allclose(res, -torch.cos(a) * torch.sin(b), atol=tol, rtol=0)
+        assert torch.allclose(res, expected, atol=tol, rtol=0)
         spy.assert_not_called()
 
-    def test_gradient_integration(self, tol):
+    def test_gradient_integration(self, device_factory, tol):
         """Test that temporarily setting the shots works
         for gradient computations"""
-        dev = qml.device("default.qubit", wires=2, shots=None)
+        dev = device_factory("default.qubit", wires=2, shots=None)
         a, b = torch.tensor([0.543, -0.654], requires_grad=True)
 
         @qnode(dev, interface="torch", diff_method=qml.gradients.param_shift)
@@ -495,19 +565,23 @@ class TestShotsIntegration:
             qml.CNOT(wires=[0, 1])
             return qml.expval(qml.PauliY(1))
 
-        res = jacobian(lambda a, b: cost_fn(a, b, shots=[10000, 10000, 10000]), (a, b))
-        res = qml.math.transpose(torch.stack(res))
+        # evaluate the QNode once, and backpropagate through each shot batch
+        out = cost_fn(a, b, shots=[2000, 2000, 2000])
+        res = torch.stack(
+            [torch.stack(torch.autograd.grad(r, (a, b), retain_graph=True)) for r in out]
+        )
         assert dev.shots is None
         assert len(res) == 3
 
-        expected = torch.tensor([torch.sin(a) * torch.sin(b), -torch.cos(a) * torch.cos(b)])
+        with torch.no_grad():
+            expected = torch.tensor([torch.sin(a) * torch.sin(b), -torch.cos(a) * torch.cos(b)])
         assert torch.allclose(torch.mean(res, axis=0), expected, atol=0.1, rtol=0)
 
-    def test_multiple_gradient_integration(self, tol):
+    def test_multiple_gradient_integration(self, device_factory, tol):
         """Test that temporarily setting the shots works
         for gradient computations, even if the QNode has been re-evaluated
         with a different number of shots in the meantime."""
-        dev = qml.device("default.qubit", wires=2, shots=None)
+        dev = device_factory("default.qubit", wires=2, shots=None)
         weights = torch.tensor([0.543, -0.654], requires_grad=True)
         a, b = weights
 
@@ -521,17 +595,18 @@ class TestShotsIntegration:
         res1 = circuit(*weights)
         assert qml.math.shape(res1) == tuple()
 
-        res2 = circuit(*weights, shots=[(1, 1000)])
-        assert qml.math.shape(res2) == (1000,)
+        res2 = circuit(*weights, shots=[(1, 100)])
+        assert qml.math.shape(res2) == (100,)
 
         res1.backward()
 
-        expected = torch.tensor([torch.sin(a) * torch.sin(b), -torch.cos(a) * torch.cos(b)])
+        with torch.no_grad():
+            expected = torch.tensor([torch.sin(a) * torch.sin(b), -torch.cos(a) * torch.cos(b)])
         assert torch.allclose(weights.grad, expected, atol=tol, rtol=0)
 
-    def test_update_diff_method(self, mocker, tol):
+    def test_update_diff_method(self, device_factory, mocker, tol):
         """Test that temporarily setting the shots updates the diff method"""
-        dev = qml.device("default.qubit", wires=2, shots=100)
+        dev = device_factory("default.qubit", wires=2, shots=100)
         a, b = torch.tensor([0.543, -0.654], requires_grad=True)
 
         spy = mocker.spy(qml, "execute")
@@ -563,9 +638,9 @@ class TestShotsIntegration:
 class TestAdjoint:
     """Specific integration tests for the adjoint method"""
 
-    def test_reuse_state(self, mocker):
+    def test_reuse_state(self, device_factory, mocker):
         """Tests that the Torch interface reuses the device state for adjoint differentiation"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = device_factory("default.qubit", wires=2)
 
         @qnode(dev, diff_method="adjoint", interface="torch")
         def circ(x):
@@ -582,14 +657,17 @@ class TestAdjoint:
         res1 = circ(x1)
         res1.backward(torch.Tensor([1, 1]))
 
-        assert np.allclose(x1.grad, expected_grad(x1))
+        with torch.no_grad():
+            expected = expected_grad(x1)
+
+        assert torch.allclose(x1.grad, expected)
         assert circ.device.num_executions == 1
-        spy.assert_called_with(mocker.ANY, use_device_state=mocker.ANY)
+        spy.assert_called_with(mocker.ANY, use_device_state=True)
 
-    def test_resuse_state_multiple_evals(self, mocker, tol):
+    def test_resuse_state_multiple_evals(self, device_factory, mocker, tol):
         """Tests that the Torch interface reuses the device state for adjoint differentiation,
         even where there are intermediate evaluations."""
-        dev = qml.device("default.qubit", wires=2)
+        dev = device_factory("default.qubit", wires=2)
 
         x_val = 0.543
         y_val = -0.654
@@ -606,32 +684,30 @@ class TestAdjoint:
         spy = mocker.spy(dev, "adjoint_jacobian")
 
         res1 = circuit(x, y)
-        assert np.allclose(res1.detach(), np.cos(x_val), atol=tol, rtol=0)
+        assert _close(res1, np.cos(x_val), tol)
 
         # intermediate evaluation with different values
         res2 = circuit(torch.tan(x), torch.cosh(y))
 
         # the adjoint method will continue to compute the correct derivative
         res1.backward()
-        assert np.allclose(x.grad.detach(), -np.sin(x_val), atol=tol, rtol=0)
+        assert _close(x.grad, -np.sin(x_val), tol)
         assert dev.num_executions == 2
-        spy.assert_called_with(mocker.ANY, use_device_state=mocker.ANY)
+        spy.assert_called_with(mocker.ANY, use_device_state=True)
 
 
-@pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
 class TestQubitIntegration:
     """Tests that ensure various qubit circuits integrate correctly"""
 
-    def test_probability_differentiation(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_ADJOINT)
+    def test_probability_differentiation(self, device_factory, dev_name, diff_method, mode, tol):
         """Tests correct output shape and evaluation for a tape
         with prob and expval outputs"""
 
-        if diff_method == "adjoint":
-            pytest.skip("The adjoint method does not currently support returning probabilities")
-
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
         x_val = 0.543
         y_val = -0.654
+        cx, sx, cy, sy = np.cos(x_val), np.sin(x_val), np.cos(y_val), np.sin(y_val)
         x = torch.tensor(x_val, requires_grad=True)
         y = torch.tensor(y_val, requires_grad=True)
 
@@ -644,14 +720,9 @@ class TestQubitIntegration:
 
         res = circuit(x, y)
 
-        expected = np.array(
-            [
-                [np.cos(x_val / 2) ** 2, np.sin(x_val / 2) ** 2],
-                [
-                    (1 + np.cos(x_val) * np.cos(y_val)) / 2,
-                    (1 - np.cos(x_val) * np.cos(y_val)) / 2,
-                ],
-            ]
+        expected = torch.tensor(
+            [[(1 + cx) / 2, (1 - cx) / 2], [(1 + cx * cy) / 2, (1 - cx * cy) / 2]],
+            dtype=res.dtype,
         )
 
         if diff_method == "backprop":
@@ -659,31 +730,28 @@ class TestQubitIntegration:
             # https://github.com/PennyLaneAI/pennylane/issues/1607
             expected = expected.flatten()
 
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        assert _close(res, expected, tol)
 
-        loss = torch.sum(res)
-        loss.backward()
+        res.backward(torch.ones_like(res))
         expected = np.array(
             [
-                -np.sin(x_val) / 2
-                + np.sin(x_val) / 2
-                - np.sin(x_val) * np.cos(y_val) / 2
-                + np.cos(y_val) * np.sin(x_val) / 2,
-                -np.cos(x_val) * np.sin(y_val) / 2 + np.cos(x_val) * np.sin(y_val) / 2,
+                -sx / 2 + sx / 2 - sx * cy / 2 + cy * sx / 2,
+                -cx * sy / 2 + cx * sy / 2,
             ]
         )
-        assert np.allclose(x.grad, expected[0], atol=tol, rtol=0)
-        assert np.allclose(y.grad, expected[1], atol=tol, rtol=0)
+        assert _close(x.grad, expected[0], tol)
+        assert _close(y.grad, expected[1], tol)
 
-    def test_ragged_differentiation(self, dev_name, diff_method, mode, monkeypatch, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_ADJOINT)
+    def test_ragged_differentiation(
+        self, device_factory, dev_name, diff_method, mode, monkeypatch, tol
+    ):
         """Tests correct output shape and evaluation for a tape
         with prob and expval outputs"""
-        if diff_method == "adjoint":
-            pytest.skip("The adjoint method does not currently support returning probabilities")
-
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
         x_val = 0.543
         y_val = -0.654
+        cx, sx, cy, sy = np.cos(x_val), np.sin(x_val), np.cos(y_val), np.sin(y_val)
         x = torch.tensor(x_val, requires_grad=True)
         y = torch.tensor(y_val, requires_grad=True)
 
@@ -696,34 +764,23 @@ class TestQubitIntegration:
 
         res = circuit(x, y)
 
-        expected = np.array(
-            [
-                np.cos(x_val),
-                (1 + np.cos(x_val) * np.cos(y_val)) / 2,
-                (1 - np.cos(x_val) * np.cos(y_val)) / 2,
-            ]
-        )
-        assert np.allclose(res.detach().numpy(), expected, atol=tol, rtol=0)
+        expected = torch.tensor([cx, (1 + cx * cy) / 2, (1 - cx * cy) / 2], dtype=res.dtype)
+        assert _close(res, expected, tol)
 
-        loss = torch.sum(res)
-        loss.backward()
+        res.backward(torch.ones_like(res))
         expected = np.array(
             [
-                -np.sin(x_val)
-                + -np.sin(x_val) * np.cos(y_val) / 2
-                + np.cos(y_val) * np.sin(x_val) / 2,
-                -np.cos(x_val) * np.sin(y_val) / 2 + np.cos(x_val) * np.sin(y_val) / 2,
+                -sx - sx * cy / 2 + cy * sx / 2,
+                -cx * sy / 2 + cx * sy / 2,
             ]
         )
-        assert np.allclose(x.grad, expected[0], atol=tol, rtol=0)
-        assert np.allclose(y.grad, expected[1], atol=tol, rtol=0)
+        assert _close(x.grad, expected[0], tol)
+        assert _close(y.grad, expected[1], tol)
 
-    def test_sampling(self, dev_name, diff_method, mode):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", BACKWARD_ONLY)
+    def test_sampling(self, device_factory, dev_name, diff_method, mode):
         """Test sampling works as expected"""
-        if mode == "forward":
-            pytest.skip("Sampling not possible with forward mode differentiation.")
-
-        dev = qml.device(dev_name, wires=2, shots=10)
+        dev = device_factory(dev_name, wires=2, shots=10)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit():
@@ -736,12 +793,10 @@ class TestQubitIntegration:
         assert res.shape == (2, 10)
         assert isinstance(res, torch.Tensor)
 
-    def test_sampling_expval(self, dev_name, diff_method, mode):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", BACKWARD_ONLY)
+    def test_sampling_expval(self, device_factory, dev_name, diff_method, mode):
         """Test sampling works as expected if combined with expectation values"""
-        if mode == "forward":
-            pytest.skip("Sampling not possible with forward mode differentiation.")
-
-        dev = qml.device(dev_name, wires=2, shots=10)
+        dev = device_factory(dev_name, wires=2, shots=10)
 
         @qnode(dev, diff_method=diff_method, mode=mode, interface="torch")
         def circuit():
@@ -757,10 +812,11 @@ class TestQubitIntegration:
         assert isinstance(res[0], torch.Tensor)
         assert isinstance(res[1], torch.Tensor)
 
-    @pytest.mark.xfail
-    def test_chained_qnodes(self, dev_name, diff_method, mode):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", qubit_device_and_diff_method)
+    @pytest.mark.xfail(run=False, reason="templates are not yet expanded on the device")
+    def test_chained_qnodes(self, device_factory, dev_name, diff_method, mode):
         """Test that the gradient of chained QNodes works without error"""
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, interface="torch", diff_method=diff_method, mode=mode)
         def circuit1(weights):
@@ -790,12 +846,10 @@ class TestQubitIntegration:
         loss = cost(weights)
         loss.backward()
 
-    def test_hessian(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", PS_BP)
+    def test_hessian(self, device_factory, dev_name, diff_method, mode, tol):
         """Test hessian calculation of a scalar valued QNode"""
-        if diff_method not in {"parameter-shift", "backprop"}:
-            pytest.skip("Test only supports parameter-shift or backprop")
-
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, max_diff=2, interface="torch")
         def circuit(x):
@@ -803,33 +857,32 @@ class TestQubitIntegration:
             qml.RX(x[1], wires=0)
             return qml.expval(qml.PauliZ(0))
 
-        x = torch.tensor([1.0, 2.0], requires_grad=True)
+        x = _X12.clone().requires_grad_(True)
         res = circuit(x)
 
-        res.backward()
-        g = x.grad
-
-        hess = hessian(circuit, x)
-        a, b = x.detach().numpy()
+        # differentiate the gradient of the single forward pass, rather than
+        # re-evaluating the QNode to compute the Hessian
+        (g,) = torch.autograd.grad(res, x, create_graph=True)
+        hess = torch.stack([torch.autograd.grad(g_i, x, retain_graph=True)[0] for g_i in g])
+        a, b = x.detach().tolist()
+        ca, sa, cb, sb = np.cos(a), np.sin(a), np.cos(b), np.sin(b)
 
-        expected_res = np.cos(a) * np.cos(b)
-        assert np.allclose(res.detach(), expected_res, atol=tol, rtol=0)
+        expected_res = ca * cb
+        assert _close(res, expected_res, tol)
 
-        expected_g = [-np.sin(a) * np.cos(b), -np.cos(a) * np.sin(b)]
-        assert np.allclose(g.detach(), expected_g, atol=tol, rtol=0)
+        expected_g = [-sa * cb, -ca * sb]
+        assert _close(g, expected_g, tol)
 
         expected_hess = [
-            [-np.cos(a) * np.cos(b), np.sin(a) * np.sin(b)],
-            [np.sin(a) * np.sin(b), -np.cos(a) * np.cos(b)],
+            [-ca * cb, sa * sb],
+            [sa * sb, -ca * cb],
         ]
-        assert np.allclose(hess.detach(), expected_hess, atol=tol, rtol=0)
+        assert _close(hess, expected_hess, tol)
 
-    def test_hessian_vector_valued(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", PS_BP)
+    def test_hessian_vector_valued(self, device_factory, dev_name, diff_method, mode, tol):
         """Test hessian calculation of a vector valued QNode"""
-        if diff_method not in {"parameter-shift", "backprop"}:
-            pytest.skip("Test only supports parameter-shift or backprop")
-
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, max_diff=2, interface="torch")
         def circuit(x):
@@ -837,44 +890,35 @@ class TestQubitIntegration:
             qml.RX(x[1], wires=0)
             return qml.probs(wires=0)
 
-        x = torch.tensor([1.0, 2.0], requires_grad=True)
+        x = _X12.clone().requires_grad_(True)
         res = circuit(x)
         jac_fn = lambda x: jacobian(circuit, x, create_graph=True)
 
         g = jac_fn(x)
-        hess = jacobian(jac_fn, x)
-        a, b = x.detach().numpy()
+        hess = jacobian(jac_fn, x, create_graph=False)
+        a, b = x.detach().tolist()
+        ca, sa, cb, sb = np.cos(a), np.sin(a), np.cos(b), np.sin(b)
 
         expected_res = [
-            0.5 + 0.5 * np.cos(a) * np.cos(b),
-            0.5 - 0.5 * np.cos(a) * np.cos(b),
+            0.5 + 0.5 * ca * cb,
+            0.5 - 0.5 * ca * cb,
         ]
-        assert np.allclose(res.detach(), expected_res, atol=tol, rtol=0)
+        assert _close(res, expected_res, tol)
 
         expected_g = [
-            [-0.5 * np.sin(a) * np.cos(b), -0.5 * np.cos(a) * np.sin(b)],
-            [0.5 * np.sin(a) * np.cos(b), 0.5 * np.cos(a) * np.sin(b)],
+            [-0.5 * sa * cb, -0.5 * ca * sb],
+            [0.5 * sa * cb, 0.5 * ca * sb],
         ]
-        assert np.allclose(g.detach(), expected_g, atol=tol, rtol=0)
+        assert _close(g, expected_g, tol)
 
-        expected_hess = [
-            [
-                [-0.5 * np.cos(a) * np.cos(b), 0.5 * np.sin(a) * np.sin(b)],
-                [0.5 * np.sin(a) * np.sin(b), -0.5 * np.cos(a) * np.cos(b)],
-            ],
-            [
-                [0.5 * np.cos(a) * np.cos(b), -0.5 * np.sin(a) * np.sin(b)],
-                [-0.5 * np.sin(a) * np.sin(b), 0.5 * np.cos(a) * np.cos(b)],
-            ],
-        ]
-        assert np.allclose(hess.detach(), expected_hess, atol=tol, rtol=0)
+        hess_z = np.array([[-ca * cb, sa * sb], [sa * sb, -ca * cb]])
+        expected_hess = np.stack([0.5 * hess_z, -0.5 * hess_z])
+        assert _close(hess, expected_hess, tol)
 
-    def test_hessian_ragged(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", PS_BP)
+    def test_hessian_ragged(self, device_factory, dev_name, diff_method, mode, tol):
         """Test hessian calculation of a ragged QNode"""
-        if diff_method not in {"parameter-shift", "backprop"}:
-            pytest.skip("Test only supports parameter-shift or backprop")
-
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
         @qnode(dev, diff_method=diff_method, mode=mode, max_diff=2, interface="torch")
         def circuit(x):
@@ -884,50 +928,40 @@ class TestQubitIntegration:
             qml.RX(x[1], wires=1)
             return qml.expval(qml.PauliZ(0)), qml.probs(wires=1)
 
-        x = torch.tensor([1.0, 2.0], requires_grad=True)
+        x = _X12.clone().requires_grad_(True)
         res = circuit(x)
         jac_fn = lambda x: jacobian(circuit, x, create_graph=True)
 
         g = jac_fn(x)
-        hess = jacobian(jac_fn, x)
-        a, b = x.detach().numpy()
+        hess = jacobian(jac_fn, x, create_graph=False)
+        a, b = x.detach().tolist()
+        ca, sa, cb, sb = np.cos(a), np.sin(a), np.cos(b), np.sin(b)
 
         expected_res = [
-            np.cos(a) * np.cos(b),
-            0.5 + 0.5 * np.cos(a) * np.cos(b),
-            0.5 - 0.5 * np.cos(a) * np.cos(b),
+            ca * cb,
+            0.5 + 0.5 * ca * cb,
+            0.5 - 0.5 * ca * cb,
         ]
-        assert np.allclose(res.detach(), expected_res, atol=tol, rtol=0)
+        assert _close(res, expected_res, tol)
 
         expected_g = [
-            [-np.sin(a) * np.cos(b), -np.cos(a) * np.sin(b)],
-            [-0.5 * np.sin(a) * np.cos(b), -0.5 * np.cos(a) * np.sin(b)],
-            [0.5 * np.sin(a) * np.cos(b), 0.5 * np.cos(a) * np.sin(b)],
+            [-sa * cb, -ca * sb],
+            [-0.5 * sa * cb, -0.5 * ca * sb],
+            [0.5 * sa * cb, 0.5 * ca * sb],
         ]
-        assert np.allclose(g.detach(), expected_g, atol=tol, rtol=0)
+        assert _close(g, expected_g, tol)
 
-        expected_hess = [
-            [
-                [-np.cos(a) * np.cos(b), np.sin(a) * np.sin(b)],
-                [np.sin(a) * np.sin(b), -np.cos(a) * np.cos(b)],
-            ],
-            [
-                [-0.5 * np.cos(a) * np.cos(b), 0.5 * np.sin(a) * np.sin(b)],
-                [0.5 * np.sin(a) * np.sin(b), -0.5 * np.cos(a) * np.cos(b)],
-            ],
-            [
-                [0.5 * np.cos(a) * np.cos(b), -0.5 * np.sin(a) * np.sin(b)],
-                [-0.5 * np.sin(a) * np.sin(b), 0.5 * np.cos(a) * np.cos(b)],
-            ],
-        ]
-        assert np.allclose(hess.detach(), expected_hess, atol=tol, rtol=0)
+        # the probabilities are affine in <Z>, so every Hessian block is a multiple of <Z>'s
+        hess_z = np.array([[-ca * cb, sa * sb], [sa * sb, -ca * cb]])
+        expected_hess = np.stack([hess_z, 0.5 * hess_z, -0.5 * hess_z])
+        assert _close(hess, expected_hess, tol)
 
-    def test_hessian_vector_valued_postprocessing(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", PS_BP)
+    def test_hessian_vector_valued_postprocessing(
+        self, device_factory, dev_name, diff_method, mode, tol
+    ):
         """Test hessian calculation of a vector valued QNode with post-processing"""
-        if diff_method not in {"parameter-shift", "backprop"}:
-            pytest.skip("Test only supports parameter-shift or backprop")
-
-        dev = qml.device(dev_name, wires=1)
+        dev = device_factory(dev_name, wires=1)
 
         @qnode(dev, diff_method=diff_method, mode=mode, max_diff=2, interface="torch")
         def circuit(x):
@@ -940,44 +974,39 @@ class TestQubitIntegration:
         def cost_fn(x):
             return x @ circuit(x)
 
-        a, b = x.detach().numpy()
+        a, b = x.detach().tolist()
+        ca, sa, cb, sb = np.cos(a), np.sin(a), np.cos(b), np.sin(b)
+        apb = a + b
 
         res = cost_fn(x)
-        expected_res = np.array([a, b]) @ [np.cos(a) * np.cos(b), np.cos(a) * np.cos(b)]
-        assert np.allclose(res.detach(), expected_res, atol=tol, rtol=0)
+        expected_res = np.array([a, b]) @ [ca * cb, ca * cb]
+        assert _close(res, expected_res, tol)
 
         res.backward()
 
         g = x.grad
         expected_g = [
-            np.cos(b) * (np.cos(a) - (a + b) * np.sin(a)),
-            np.cos(a) * (np.cos(b) - (a + b) * np.sin(b)),
+            cb * (ca - apb * sa),
+            ca * (cb - apb * sb),
         ]
-        assert np.allclose(g.detach(), expected_g, atol=tol, rtol=0)
+        assert _close(g, expected_g, tol)
 
-        hess = hessian(cost_fn, x)
+        hess = hessian(cost_fn, x, create_graph=False)
+        off_diag = -(cb * sa) + (-ca + apb * sa) * sb
         expected_hess = [
-            [
-                -(np.cos(b) * ((a + b) * np.cos(a) + 2 * np.sin(a))),
-                -(np.cos(b) * np.sin(a)) + (-np.cos(a) + (a + b) * np.sin(a)) * np.sin(b),
-            ],
-            [
-                -(np.cos(b) * np.sin(a)) + (-np.cos(a) + (a + b) * np.sin(a)) * np.sin(b),
-                -(np.cos(a) * ((a + b) * np.cos(b) + 2 * np.sin(b))),
-            ],
+            [-(cb * (apb * ca + 2 * sa)), off_diag],
+            [off_diag, -(ca * (apb * cb + 2 * sb))],
         ]
 
-        assert np.allclose(hess.detach(), expected_hess, atol=tol, rtol=0)
+        assert _close(hess, expected_hess, tol)
 
-    def test_state(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_ADJOINT)
+    def test_state(self, device_factory, dev_name, diff_method, mode, tol):
         """Test that the state can be returned and differentiated"""
-        if diff_method == "adjoint":
-            pytest.skip("Adjoint does not support states")
-
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
 
-        x = torch.tensor(0.543, requires_grad=True)
-        y = torch.tensor(-0.654, requires_grad=True)
+        x = torch.tensor(0.543, dtype=torch.float64, requires_grad=True)
+        y = torch.tensor(-0.654, dtype=torch.float64, requires_grad=True)
 
         @qnode(dev, diff_method=diff_method, interface="torch", mode=mode)
         def circuit(x, y):
@@ -989,7 +1018,7 @@ class TestQubitIntegration:
         def cost_fn(x, y):
             res = circuit(x, y)
             assert res.dtype is torch.complex128
-            probs = torch.abs(res) ** 2
+            probs = res.real ** 2 + res.imag ** 2
             return probs[0] + probs[2]
 
         res = cost_fn(x, y)
@@ -999,43 +1028,46 @@ class TestQubitIntegration:
 
         res.backward()
         res = torch.tensor([x.grad, y.grad])
-        expected = torch.tensor(
-            [-torch.sin(x) * torch.cos(y) / 2, -torch.cos(x) * torch.sin(y) / 2]
-        )
+        with torch.no_grad():
+            expected = torch.tensor(
+                [-torch.sin(x) * torch.cos(y) / 2, -torch.cos(x) * torch.sin(y) / 2]
+            )
         assert torch.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_projector(self, dev_name, diff_method, mode, tol):
+    @pytest.mark.parametrize("dev_name,diff_method,mode", ALL_BUT_ADJOINT)
+    def test_projector(self, device_factory, dev_name, diff_method, mode, tol):
         """Test that the variance of a projector is correctly returned"""
-        if diff_method == "adjoint":
-            pytest.skip("Adjoint does not support projectors")
-
-        dev = qml.device(dev_name, wires=2)
+        dev = device_factory(dev_name, wires=2)
         P = torch.tensor([1], requires_grad=False)
 
         x, y = 0.765, -0.654
         weights = torch.tensor([x, y], requires_grad=True)
 
         @qnode(dev, diff_method=diff_method, interface="torch", mode=mode)
-        def circuit(x, y):
-            qml.RX(x, wires=0)
-            qml.RY(y, wires=1)
+        def circuit(w):
+            qml.RX(w[0], wires=0)
+            qml.RY(w[1], wires=1)
             qml.CNOT(wires=[0, 1])
             return qml.var(qml.Projector(P, wires=0) @ qml.PauliX(1))
 
-        res = circuit(*weights)
-        expected = 0.25 * np.sin(x / 2) ** 2 * (3 + np.cos(2 * y) + 2 * np.cos(x) * np.sin(y) ** 2)
-        assert np.allclose(res.detach(), expected, atol=tol, rtol=0)
+        res = circuit(weights)
+
+        cx, sx, cy, sy = np.cos(x), np.sin(x), np.cos(y), np.sin(y)
+        cx2, sx2, c2y = np.cos(x / 2), np.sin(x / 2), np.cos(2 * y)
+
+        expected = 0.25 * sx2 ** 2 * (3 + c2y + 2 * cx * sy ** 2)
+        assert _close(res, expected, tol)
 
         res.backward()
         expected = np.array(
             [
                 [
-                    0.5 * np.sin(x) * (np.cos(x / 2) ** 2 + np.cos(2 * y) * np.sin(x / 2) ** 2),
-                    -2 * np.cos(y) * np.sin(x / 2) ** 4 * np.sin(y),
+                    0.5 * sx * (cx2 ** 2 + c2y * sx2 ** 2),
+                    -2 * cy * sx2 ** 4 * sy,
                 ]
             ]
         )
-        assert np.allclose(weights.grad.detach(), expected, atol=tol, rtol=0)
+        assert _close(weights.grad, expected, tol)
 
 
 @pytest.mark.parametrize(
@@ -1045,12 +1077,13 @@ class TestQubitIntegration:
 class TestCV:
     """Tests for CV integration"""
 
-    def test_first_order_observable(self, diff_method, kwargs, tol):
+    def test_first_order_observable(self, device_factory, diff_method, kwargs, tol):
         """Test variance of a first order CV observable"""
-        dev = qml.device("default.gaussian", wires=1)
+        dev = device_factory("default.gaussian", wires=1)
 
-        r = torch.tensor(0.543, dtype=torch.float64, requires_grad=True)
-        phi = torch.tensor(-0.654, dtype=torch.float64, requires_grad=True)
+        r_val, phi_val = 0.543, -0.654
+        r = torch.tensor(r_val, dtype=torch.float64, requires_grad=True)
+        phi = torch.tensor(phi_val, dtype=torch.float64, requires_grad=True)
 
         @qnode(dev, interface="torch", diff_method=diff_method, **kwargs)
         def circuit(r, phi):
@@ -1059,29 +1092,23 @@ class TestCV:
             return qml.var(qml.X(0))
 
         res = circuit(r, phi)
-        expected = torch.exp(2 * r) * torch.sin(phi) ** 2 + torch.exp(-2 * r) * torch.cos(phi) ** 2
-        assert torch.allclose(res, expected, atol=tol, rtol=0)
+
+        e2r, sphi, cphi = np.exp(2 * r_val), np.sin(phi_val), np.cos(phi_val)
+        expected = e2r * sphi ** 2 + cphi ** 2 / e2r
+        assert _close(res, expected, tol)
 
         # circuit jacobians
         res.backward()
-        res = torch.tensor([r.grad, phi.grad])
-        expected = torch.tensor(
-            [
-                [
-                    2 * torch.exp(2 * r) * torch.sin(phi) ** 2
-                    - 2 * torch.exp(-2 * r) * torch.cos(phi) ** 2,
-                    2 * torch.sinh(2 * r) * torch.sin(2 * phi),
-                ]
-            ]
-        )
-        assert torch.allclose(res, expected, atol=tol, rtol=0)
+        assert _close(r.grad, 2 * e2r * sphi ** 2 - 2 * cphi ** 2 / e2r, tol)
+        assert _close(phi.grad, 2 * np.sinh(2 * r_val) * np.sin(2 * phi_val), tol)
 
-    def test_second_order_observable(self, diff_method, kwargs, tol):
+    def test_second_order_observable(self, device_factory, diff_method, kwargs, tol):
         """Test variance of a second order CV expectation value"""
-        dev = qml.device("default.gaussian", wires=1)
+        dev = device_factory("default.gaussian", wires=1)
 
-        n = torch.tensor(0.12, dtype=torch.float64, requires_grad=True)
-        a = torch.tensor(0.765, dtype=torch.float64, requires_grad=True)
+        n_val, a_val = 0.12, 0.765
+        n = torch.tensor(n_val, dtype=torch.float64, requires_grad=True)
+        a = torch.tensor(a_val, dtype=torch.float64, requires_grad=True)
 
         @qnode(dev, interface="torch", diff_method=diff_method, **kwargs)
         def circuit(n, a):
@@ -1090,11 +1117,11 @@ class TestCV:
             return qml.var(qml.NumberOperator(0))
 
         res = circuit(n, a)
-        expected = n ** 2 + n + torch.abs(a) ** 2 * (1 + 2 * n)
-        assert torch.allclose(res, expected, atol=tol, rtol=0)
+
+        expected = n_val ** 2 + n_val + np.abs(a_val) ** 2 * (1 + 2 * n_val)
+        assert _close(res, expected, tol)
 
         # circuit jacobians
         res.backward()
-        res = torch.tensor([n.grad, a.grad])
-        expected = torch.tensor([[2 * a ** 2 + 2 * n + 1, 2 * a * (2 * n + 1)]])
-        assert torch.allclose(res, expected, atol=tol, rtol=0)
+        assert _close(n.grad, 2 * a_val ** 2 + 2 * n_val + 1, tol)
+        assert _close(a.grad, 2 * a_val * (2 * n_val + 1), tol)
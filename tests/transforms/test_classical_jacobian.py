@@ -16,7 +16,10 @@ import pytest
 import numpy as np
 
 import pennylane as qml
-from pennylane.transforms.classical_jacobian import classical_jacobian
+from pennylane.transforms.classical_jacobian import (
+    classical_jacobian,
+    _interface_jacobian_builder,
+)
 
 a = -2.1
 b = 0.71
@@ -369,3 +372,116 @@ def test_torch_with_sequence_argnum(circuit, args, expected_jac, argnum, diff_me
     assert len(jac) == len(expected_jac)
     for _jac, _expected_jac in zip(jac, expected_jac):
         assert np.allclose(_jac, _expected_jac)
+
+
+def test_tf_unconnected_argument():
+    r"""Test that ``classical_jacobian`` with TensorFlow returns ``None`` for a QNode
+    argument that no gate argument depends on."""
+    tf = pytest.importorskip("tensorflow")
+
+    def circuit(a, b):
+        qml.RX(a, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    args = (tf.Variable(0.4, dtype=tf.double), tf.Variable(0.2, dtype=tf.double))
+    dev = qml.device("default.qubit", wires=1)
+    qnode = qml.QNode(circuit, dev, interface="tf")
+    jac = classical_jacobian(qnode)(*args)
+    assert len(jac) == 2
+    assert np.allclose(jac[0], [1.0])
+    assert jac[1] is None
+
+
+@pytest.fixture
+def torch_jacobian_spy(monkeypatch):
+    """Patches the Torch Jacobian function used by ``classical_jacobian``, so that
+    vectorized calls raise a batching rule error after the forward pass, and records
+    the ``vectorize`` argument of each call."""
+    torch = pytest.importorskip("torch")
+    original_jacobian = torch.autograd.functional.jacobian
+    calls = []
+
+    def jacobian(func, inputs, vectorize=False, **kwargs):
+        calls.append(vectorize)
+        if vectorize:
+            func(*(i.detach().requires_grad_(True) for i in inputs))
+            raise RuntimeError("Batching rule not implemented for aten::detach")
+        return original_jacobian(func, inputs, vectorize=vectorize, **kwargs)
+
+    monkeypatch.setattr(torch.autograd.functional, "jacobian", jacobian)
+    _interface_jacobian_builder.cache_clear()
+    yield calls
+    _interface_jacobian_builder.cache_clear()
+
+
+def test_torch_vectorize_fallback(torch_jacobian_spy):
+    r"""Test that ``classical_jacobian`` with Torch falls back to the non-vectorized
+    Jacobian if vectorization is not supported, and only tries to vectorize once."""
+    import torch
+
+    dev = qml.device("default.qubit", wires=2)
+    qnode = qml.QNode(circuit_0, dev, interface="torch")
+
+    for _ in range(2):
+        jac = classical_jacobian(qnode)(torch.tensor(a))
+        assert len(jac) == len(class_jacs[0])
+        for _jac, _expected_jac in zip(jac, class_jacs[0]):
+            assert np.allclose(_jac, _expected_jac)
+
+    assert torch_jacobian_spy == [True, False, False]
+
+
+def test_torch_unrelated_error_is_raised(torch_jacobian_spy):
+    r"""Test that ``classical_jacobian`` with Torch does not fall back to the
+    non-vectorized Jacobian for errors raised by the quantum function."""
+    import torch
+
+    evaluations = []
+
+    def circuit(a):
+        evaluations.append(a)
+        raise RuntimeError("Error in the quantum function")
+
+    dev = qml.device("default.qubit", wires=1)
+    qnode = qml.QNode(circuit, dev, interface="torch")
+
+    with pytest.raises(RuntimeError, match="Error in the quantum function"):
+        classical_jacobian(qnode)(torch.tensor(a))
+
+    assert len(evaluations) == 1
+    assert torch_jacobian_spy == [True]
+
+
+def test_interface_jacobian_builder_is_cached():
+    r"""Test that the interface-specific Jacobian builder is only created once per interface."""
+    builder = _interface_jacobian_builder("autograd")
+    assert _interface_jacobian_builder("autograd") is builder
+
+    dev = qml.device("default.qubit", wires=2)
+    qnode = qml.QNode(circuit_0, dev, interface="autograd")
+    jac = classical_jacobian(qnode)(a)
+    assert np.allclose(jac, class_jacs[0])
+    assert _interface_jacobian_builder("autograd") is builder
+
+
+def test_unsupported_interface_returns_none():
+    r"""Test that ``classical_jacobian`` returns ``None`` for an unsupported interface."""
+    dev = qml.device("default.qubit", wires=2)
+    qnode = qml.QNode(circuit_0, dev, interface=None)
+    assert classical_jacobian(qnode) is None
+
+
+def test_torch_no_trainable_parameters():
+    r"""Test that ``classical_jacobian`` with Torch raises the same error as
+    ``qml.math.stack`` if the QNode has no trainable gate arguments."""
+    torch = pytest.importorskip("torch")
+
+    def circuit(x):
+        qml.RX(0.3, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    dev = qml.device("default.qubit", wires=1)
+    qnode = qml.QNode(circuit, dev, interface="torch")
+
+    with pytest.raises(ValueError, match="need at least one array to stack"):
+        classical_jacobian(qnode)(torch.tensor(0.1, requires_grad=True))
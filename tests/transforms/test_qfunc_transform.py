@@ -14,10 +14,28 @@
 """
 Unit tests for the qfunc transform decorators.
 """
+import inspect
+
 import pytest
 
 import pennylane as qml
 from pennylane import numpy as np
+from pennylane.transforms.qfunc_transforms import (
+    NonQueuingTape,
+    _iter_ops,
+    _non_queuing_tape_class,
+)
+
+
+def test_iter_ops():
+    """Test that _iter_ops iterates over the operations of a tape,
+    followed by its measurements"""
+    with qml.tape.QuantumTape() as tape:
+        qml.BasisState(np.array([1]), wires=0)
+        qml.RX(0.1, wires=0)
+        qml.expval(qml.PauliZ(0))
+
+    assert list(_iter_ops(tape)) == tape.operations + tape.measurements
 
 
 class TestSingleTapeTransform:
@@ -66,6 +84,30 @@ class TestSingleTapeTransform:
 
         assert ops[3].name == "CZ"
 
+    def test_non_queuing_tape_class_cached(self):
+        """Test that the non-queuing tape subclass is only created once per
+        tape class, and that the transformed tape has the original class"""
+
+        @qml.single_tape_transform
+        def identity_transform(tape):
+            for op in tape.operations + tape.measurements:
+                op.queue()
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.1, wires=0)
+
+        tape_class = _non_queuing_tape_class(qml.tape.JacobianTape)
+        assert issubclass(tape_class, NonQueuingTape)
+        assert issubclass(tape_class, qml.tape.JacobianTape)
+
+        new_tape1 = identity_transform(tape)
+        new_tape2 = identity_transform(tape)
+
+        assert _non_queuing_tape_class(qml.tape.JacobianTape) is tape_class
+        assert type(new_tape1) is qml.tape.JacobianTape
+        assert type(new_tape2) is qml.tape.JacobianTape
+        assert new_tape2.operations[0].parameters == [0.1]
+
 
 class TestQFuncTransforms:
     """Tests for the qfunc_transform decorator"""
@@ -302,6 +344,27 @@ class TestQFuncTransforms:
         assert np.allclose(normal_result, transformed_result)
         assert normal_result.shape == transformed_result.shape
 
+    def test_transformed_qfunc_signature(self):
+        """Test that the transformed qfunc keeps the signature of the original
+        qfunc, so that a QNode can detect whether the qfunc accepts shots."""
+
+        @qml.qfunc_transform
+        def my_transform(tape, a):
+            for op in tape.operations + tape.measurements:
+                op.queue()
+
+        def ansatz(x, shots=None):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        transformed_ansatz = my_transform(0.1)(ansatz)
+        assert transformed_ansatz.__name__ == "ansatz"
+        assert list(inspect.signature(transformed_ansatz).parameters) == ["x", "shots"]
+
+        dev = qml.device("default.qubit", wires=1)
+        qnode = qml.QNode(transformed_ansatz, dev)
+        assert qnode._qfunc_uses_shots_arg
+
 
 ############################################
 # Test transform, ansatz, and qfunc function